@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from .ui.app import run_gui as run_gui
-
 __all__ = ["run_gui"]
 
 
+def run_gui() -> None:
+    # Imported on call so headless entry points (API, MCP) never load PyQt6.
+    from .ui.app import run_gui as _run_gui
+
+    _run_gui()
+
+
 def main() -> None:
     run_gui()
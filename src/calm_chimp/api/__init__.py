@@ -7,5 +7,6 @@ from .state import api_state
 
 # Import endpoints so decorators run at module import time.
 from . import endpoints  # noqa: F401
+from .endpoints import TIMELINE_MUTATING_TOOLS
 
-__all__ = ["ApiFunction", "api_state", "call_api", "get_api_functions", "register_api"]
+__all__ = ["ApiFunction", "TIMELINE_MUTATING_TOOLS", "api_state", "call_api", "get_api_functions", "register_api"]
@@ -8,6 +8,11 @@ from .registry import register_api
 from .serializers import serialize_category, serialize_event
 from .state import api_state
 
+# Tools whose successful run changes the cached timeline.
+TIMELINE_MUTATING_TOOLS: frozenset[str] = frozenset(
+    {"refresh_timeline", "upsert_event", "update_event_status", "delete_event"}
+)
+
 
 def _require_session() -> None:
     if not api_state.context.gateway.is_ready():
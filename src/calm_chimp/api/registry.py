@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import types
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union, get_args, get_origin
 
 JsonSchema = Dict[str, Any]
@@ -39,7 +40,7 @@ def _parameter_schema(param: inspect.Parameter) -> JsonSchema:
     return schema
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ApiFunction:
     name: str
     func: Callable[..., Any]
@@ -48,11 +49,11 @@ class ApiFunction:
     tags: tuple[str, ...]
     signature: inspect.Signature
 
-    @property
+    @cached_property
     def parameters(self) -> Dict[str, str]:
         return {param.name: str(param.annotation) for param in self.signature.parameters.values()}
 
-    @property
+    @cached_property
     def parameter_schema(self) -> JsonSchema:
         schema: JsonSchema = {"type": "object", "properties": {}, "required": []}
         for param in self.signature.parameters.values():
@@ -95,13 +96,15 @@ def register_api(
             tags=tuple(tags or ()),
             signature=inspect.signature(func),
         )
+        get_api_functions.cache_clear()
         return func
 
     return decorator
 
 
-def get_api_functions() -> List[ApiFunction]:
-    return list(REGISTRY.values())
+@lru_cache(maxsize=None)
+def get_api_functions() -> tuple[ApiFunction, ...]:
+    return tuple(REGISTRY.values())
 
 
 def call_api(name: str, **kwargs: Any) -> Any:
@@ -9,11 +9,19 @@ from typing import Optional
 LOG_LEVEL = os.getenv("CALM_CHIMP_LOG_LEVEL", "INFO").upper()
 LOG_DIR = Path(os.getenv("CALM_CHIMP_LOG_DIR", Path.cwd() / "logs"))
 
+_configured = False
+
 
 def configure_logging(*, level: Optional[str] = None) -> None:
     """Configure application-wide logging with rotation-friendly file output."""
 
+    global _configured
     resolved_level = getattr(logging, (level or LOG_LEVEL), logging.INFO)
+    if _configured:
+        # Handlers are installed once; an explicit level on a later call still takes effect.
+        if level is not None:
+            logging.getLogger().setLevel(resolved_level)
+        return
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%d")
     log_path = LOG_DIR / f"calmchimp-{timestamp}.log"
@@ -28,3 +36,4 @@ def configure_logging(*, level: Optional[str] = None) -> None:
         format="%(asctime)s [%(levelname)s] %(name)s — %(message)s",
         handlers=handlers,
     )
+    _configured = True
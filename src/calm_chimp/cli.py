@@ -4,9 +4,6 @@ import argparse
 import logging
 
 from .bootstrap import configure_logging
-from .services.http import run_local_server
-from .services.mcp import run_mcp_server
-from .ui.app import run_gui
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -32,11 +29,18 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    # Each command imports only its own stack (PyQt6, FastAPI, or FastMCP).
     if args.command == "gui":
+        from .ui.app import run_gui
+
         run_gui()
     elif args.command == "api":
+        from .services.http import run_local_server
+
         run_local_server(host=args.host, port=args.port)
     elif args.command == "mcp":
+        from .services.mcp import run_mcp_server
+
         run_mcp_server(host=args.host, port=args.port)
     else:  # pragma: no cover - argparse enforces choices
         parser.print_help()
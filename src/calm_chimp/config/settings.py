@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LlmSettings:
     api_key: Optional[str]
     model: str
@@ -19,6 +19,7 @@ class LlmSettings:
     api_version: Optional[str]
     organization: Optional[str]
     project: Optional[str]
+    history_limit: int
 
     @property
     def is_configured(self) -> bool:
@@ -34,7 +35,7 @@ class LlmSettings:
         return missing
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupabaseSettings:
     url: Optional[str]
     anon_key: Optional[str]
@@ -50,7 +51,7 @@ class SupabaseSettings:
         return f"http://{self.redirect_host}:{self.redirect_port}/auth/callback"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheSettings:
     window_before: timedelta
     window_after: timedelta
@@ -58,21 +59,21 @@ class CacheSettings:
     refresh_interval: timedelta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UiSettings:
     app_name: str
     organization: str
     timezone: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageSettings:
     events_table: str
     categories_table: str
     profiles_table: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     llm: LlmSettings
     supabase: SupabaseSettings
@@ -92,41 +93,43 @@ def _timedelta_from_env(name: str, default_days: int) -> timedelta:
     return timedelta(days=days)
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
 def get_settings() -> AppSettings:
+    env = os.environ.get
     llm = LlmSettings(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        model=os.getenv("OPENAI_MODEL", "gpt-5.2"),
-        base_url=os.getenv("OPENAI_BASE_URL"),
-        api_version=os.getenv("OPENAI_API_VERSION"),
-        organization=os.getenv("OPENAI_ORG"),
-        project=os.getenv("OPENAI_PROJECT"),
+        api_key=env("OPENAI_API_KEY"),
+        model=env("OPENAI_MODEL", "gpt-5.2"),
+        base_url=env("OPENAI_BASE_URL"),
+        api_version=env("OPENAI_API_VERSION"),
+        organization=env("OPENAI_ORG"),
+        project=env("OPENAI_PROJECT"),
+        history_limit=int(env("CALM_CHAT_HISTORY_LIMIT", "0")),
     )
 
     supabase = SupabaseSettings(
-        url=os.getenv("SUPABASE_URL"),
-        anon_key=os.getenv("SUPABASE_ANON_KEY"),
-        redirect_host=os.getenv("SUPABASE_REDIRECT_HOST", "127.0.0.1"),
-        redirect_port=int(os.getenv("SUPABASE_REDIRECT_PORT", "52151")),
+        url=env("SUPABASE_URL"),
+        anon_key=env("SUPABASE_ANON_KEY"),
+        redirect_host=env("SUPABASE_REDIRECT_HOST", "127.0.0.1"),
+        redirect_port=int(env("SUPABASE_REDIRECT_PORT", "52151")),
     )
 
     cache = CacheSettings(
         window_before=_timedelta_from_env("CALM_CACHE_WINDOW_BEFORE_DAYS", 365),
         window_after=_timedelta_from_env("CALM_CACHE_WINDOW_AFTER_DAYS", 365),
-        max_results=int(os.getenv("CALM_CACHE_MAX_RESULTS", "5000")),
-        refresh_interval=timedelta(seconds=int(os.getenv("CALM_CACHE_REFRESH_SECONDS", "90"))),
+        max_results=int(env("CALM_CACHE_MAX_RESULTS", "5000")),
+        refresh_interval=timedelta(seconds=int(env("CALM_CACHE_REFRESH_SECONDS", "90"))),
     )
 
     ui = UiSettings(
-        app_name=os.getenv("CALM_APP_NAME", "Calm Chimp"),
-        organization=os.getenv("CALM_APP_ORG", "CalmChimp"),
-        timezone=os.getenv("CALM_APP_TIMEZONE", "UTC"),
+        app_name=env("CALM_APP_NAME", "Calm Chimp"),
+        organization=env("CALM_APP_ORG", "CalmChimp"),
+        timezone=env("CALM_APP_TIMEZONE", "UTC"),
     )
 
     storage = StorageSettings(
-        events_table=os.getenv("SUPABASE_EVENTS_TABLE", "calendar_events"),
-        categories_table=os.getenv("SUPABASE_CATEGORIES_TABLE", "event_categories"),
-        profiles_table=os.getenv("SUPABASE_PROFILES_TABLE", "profiles"),
+        events_table=env("SUPABASE_EVENTS_TABLE", "calendar_events"),
+        categories_table=env("SUPABASE_CATEGORIES_TABLE", "event_categories"),
+        profiles_table=env("SUPABASE_PROFILES_TABLE", "profiles"),
     )
 
     return AppSettings(llm=llm, supabase=supabase, cache=cache, ui=ui, storage=storage)
@@ -150,6 +150,23 @@ class AppPalette:
             font-size: 12px;
             font-weight: 600;
         }}
+        QLabel#statusLabel {{
+            color: #e0e7ff;
+            background-color: #111a2e;
+            border: 1px solid #1f2a44;
+            padding: 8px 12px;
+            border-radius: 6px;
+        }}
+        QLabel#statusLabel[kind="success"] {{
+            color: #4ade80;
+            background-color: #11261a;
+            border: 1px solid #1f3d29;
+        }}
+        QLabel#statusLabel[kind="error"] {{
+            color: #f87171;
+            background-color: #2e1114;
+            border: 1px solid #4e1c22;
+        }}
         QWidget#sidebarPanel {{
             background-color: {self.surface_alt};
             border-right: 1px solid {self.border_strong};
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
+import threading
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from openai import OpenAI
 
-from ..api import call_api, get_api_functions
-from ..config import get_settings
+from ..api import ApiFunction, call_api, get_api_functions
+from ..config import LlmSettings, get_settings
 from .prompts import SYSTEM_PROMPT
 from .verifiers import VerificationResult, verify_tool_output
 
@@ -19,14 +25,129 @@ def _json_default(value: Any) -> str:
     return str(value)
 
 
+def _encode_log_entry(entry: Dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(entry, default=_json_default, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects e.g. integers wider than 64 bits; the stdlib encoder handles those.
+        pass
+    try:
+        return json.dumps(entry, default=_json_default).encode("utf-8") + b"\n"
+    except (TypeError, ValueError):
+        return json.dumps({"unserializable_entry": str(entry)}).encode("utf-8") + b"\n"
+
+
+_STOP = object()
+
+
+class _RunLogWriter:
+    """Background writer that appends agent run entries to a JSONL file in batches."""
+
+    def __init__(self, path: Path, *, max_pending: int = 4096, batch_size: int = 64) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            # Logging must never block the caller; drop the entry instead.
+            return
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write any pending entries and stop the writer thread (registered with ``atexit``)."""
+
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="agent-run-log", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            stop = item is _STOP
+            batch = [] if stop else [item]
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception:
+                    # Logging failures should never disrupt the UI.
+                    pass
+            if stop:
+                return
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Entries are encoded one at a time so a single bad entry cannot take the batch with it.
+        payload = b"".join(_encode_log_entry(entry) for entry in batch)
+        with self.path.open("ab") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+_run_log = _RunLogWriter(Path("logs/agent_runs/runs.jsonl"))
+atexit.register(_run_log.close)
+
+
+@lru_cache(maxsize=None)
+def _shared_client(settings: LlmSettings) -> OpenAI:
+    # One client per configuration keeps a single keep-alive connection pool per process.
+    default_query = {}
+    if settings.api_version:
+        default_query["api-version"] = settings.api_version
+    return OpenAI(
+        api_key=settings.api_key,
+        base_url=settings.base_url,
+        organization=settings.organization,
+        project=settings.project,
+        default_query=default_query or None,
+    )
+
+
+_SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+@lru_cache(maxsize=1)
+def _tool_payloads(specs: tuple[ApiFunction, ...]) -> tuple[Dict[str, Any], ...]:
+    return tuple(spec.as_tool() for spec in specs)
+
+
 class LangGraphOrchestrator:
     """Thin, single-step orchestrator that lets the model pick one tool."""
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client = self._build_client()
-        self._tool_specs = get_api_functions()
-        self._tools = [spec.as_tool() for spec in self._tool_specs]
+
+    @cached_property
+    def _tools(self) -> tuple[Dict[str, Any], ...]:
+        # Built on first model call so the offline route never pays for the catalog.
+        return _tool_payloads(get_api_functions())
 
     # ------------------------------------------------------------------ public API
 
@@ -35,7 +156,9 @@ class LangGraphOrchestrator:
         if not self._client:
             return self._offline_route(user_message, reason="LLM not configured")
 
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}, *history, {"role": "user", "content": user_message}]
+        limit = self.settings.llm.history_limit
+        recent = history[-limit:] if limit > 0 else history
+        messages = [_SYSTEM_MESSAGE, *recent, {"role": "user", "content": user_message}]
         try:
             completion = self._client.chat.completions.create(
                 model=self.settings.llm.model,
@@ -86,42 +209,40 @@ class LangGraphOrchestrator:
 
     # ------------------------------------------------------------------ helpers
 
-    def _build_client(self) -> Optional[OpenAI]:
+    @cached_property
+    def _client(self) -> Optional[OpenAI]:
+        # Created on the first chat turn (a worker thread), not when the main window is built.
         if not self.settings.llm.is_configured:
             return None
-        default_query = {}
-        if self.settings.llm.api_version:
-            default_query["api-version"] = self.settings.llm.api_version
-        return OpenAI(
-            api_key=self.settings.llm.api_key,
-            base_url=self.settings.llm.base_url,
-            organization=self.settings.llm.organization,
-            project=self.settings.llm.project,
-            default_query=default_query or None,
-        )
+        return _shared_client(self.settings.llm)
 
     def _safe_json(self, raw: Any) -> Dict[str, Any]:
         if not raw:
             return {}
+        opener = b"{" if isinstance(raw, (bytes, bytearray)) else "{"
+        if not raw.lstrip().startswith(opener):
+            # Only JSON objects are usable as tool arguments; skip the parse otherwise.
+            return {}
         try:
-            parsed = json.loads(raw)
-            return parsed if isinstance(parsed, dict) else {}
-        except json.JSONDecodeError:
+            # orjson accepts str and bytes as-is, and a document opening with "{" always decodes to a dict.
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return {}
 
     def _offline_route(self, user_message: str, *, reason: str) -> Dict[str, Any]:
         hint = reason or "No model configured."
         normalized = user_message.lower()
         if "today" in normalized and "event" in normalized:
+            arguments = {"day": datetime.utcnow().date().isoformat()}
             output: Optional[Dict[str, Any]] = None
             try:
-                output = call_api("events_for_day", day=datetime.utcnow().date().isoformat())
+                output = call_api("events_for_day", **arguments)
             except Exception:
                 output = None
             return {
                 "messages": [f"{hint} Routing offline to `events_for_day` for today."],
                 "tool_name": "events_for_day",
-                "arguments": {"day": datetime.utcnow().date().isoformat()},
+                "arguments": arguments,
                 "tool_output": output,
             }
         return {
@@ -150,7 +271,8 @@ class LangGraphOrchestrator:
         model: str,
     ) -> None:
         entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Formatted by orjson on the writer thread; same output as isoformat().
+            "timestamp": datetime.utcnow(),
             "model": model,
             "user_message": user_message,
             "history_length": len(history),
@@ -159,11 +281,4 @@ class LangGraphOrchestrator:
             "tool_output": tool_output,
             "verification": verification.to_dict() if verification else None,
         }
-        try:
-            logs_dir = Path("logs/agent_runs")
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            filename = logs_dir / f"{datetime.utcnow().isoformat().replace(':', '-')}.json"
-            filename.write_text(json.dumps(entry, indent=2, default=_json_default))
-        except Exception:
-            # Logging failures should never disrupt the UI.
-            return
+        _run_log.put(entry)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationResult:
     ok: bool
     summary: str
@@ -13,50 +14,77 @@ class VerificationResult:
         return {"ok": self.ok, "summary": self.summary}
 
 
+# Results are immutable, so count-only outcomes can be shared between runs.
+@lru_cache(maxsize=256)
+def _events_result(count: int) -> VerificationResult:
+    return VerificationResult(True, f"Returned {count} events.")
+
+
+@lru_cache(maxsize=256)
+def _categories_result(count: int) -> VerificationResult:
+    return VerificationResult(True, f"Returned {count} categories.")
+
+
+def _verify_refresh(output: Dict[str, Any]) -> VerificationResult:
+    count = output.get("event_count")
+    return VerificationResult(True, f"Cache primed ({count} events).") if count is not None else VerificationResult(
+        False, "Missing event count."
+    )
+
+
+def _verify_events(output: Dict[str, Any]) -> VerificationResult:
+    events = output.get("events")
+    if isinstance(events, list):
+        return _events_result(len(events))
+    return VerificationResult(False, "Missing events list.")
+
+
+def _verify_upsert_event(output: Dict[str, Any]) -> VerificationResult:
+    event = output.get("event")
+    if event and event.get("id"):
+        return VerificationResult(True, f"Event saved ({event.get('title', 'untitled')}).")
+    return VerificationResult(False, "Event payload missing id.")
+
+
+def _verify_delete(output: Dict[str, Any]) -> VerificationResult:
+    return VerificationResult(True, f"Deleted {output.get('deleted')}.") if output.get("deleted") else VerificationResult(
+        False, "Delete acknowledgement missing."
+    )
+
+
+def _verify_categories(output: Dict[str, Any]) -> VerificationResult:
+    categories = output.get("categories")
+    if isinstance(categories, list):
+        return _categories_result(len(categories))
+    return VerificationResult(False, "Missing categories list.")
+
+
+def _verify_upsert_category(output: Dict[str, Any]) -> VerificationResult:
+    category = output.get("category")
+    if category and category.get("id"):
+        return VerificationResult(True, f"Category saved ({category.get('name', 'unnamed')}).")
+    return VerificationResult(False, "Category payload missing id.")
+
+
+_VERIFIERS: Dict[str, Callable[[Dict[str, Any]], VerificationResult]] = {
+    "refresh_timeline": _verify_refresh,
+    "events_for_day": _verify_events,
+    "events_between": _verify_events,
+    "upsert_event": _verify_upsert_event,
+    "delete_event": _verify_delete,
+    "list_categories": _verify_categories,
+    "upsert_category": _verify_upsert_category,
+    "delete_category": _verify_delete,
+}
+
+
 def verify_tool_output(tool_name: str, output: Optional[Dict[str, Any]]) -> VerificationResult:
     if output is None:
         return VerificationResult(False, "No output returned.")
     if not isinstance(output, dict):
         return VerificationResult(False, "Output is not a mapping.")
 
-    if tool_name == "refresh_timeline":
-        count = output.get("event_count")
-        return VerificationResult(True, f"Cache primed ({count} events).") if count is not None else VerificationResult(
-            False, "Missing event count."
-        )
-
-    if tool_name in {"events_for_day", "events_between"}:
-        events = output.get("events")
-        if isinstance(events, list):
-            return VerificationResult(True, f"Returned {len(events)} events.")
-        return VerificationResult(False, "Missing events list.")
-
-    if tool_name == "upsert_event":
-        event = output.get("event") if isinstance(output, dict) else None
-        if event and event.get("id"):
-            return VerificationResult(True, f"Event saved ({event.get('title', 'untitled')}).")
-        return VerificationResult(False, "Event payload missing id.")
-
-    if tool_name == "delete_event":
-        return VerificationResult(True, f"Deleted {output.get('deleted')}.") if output.get("deleted") else VerificationResult(
-            False, "Delete acknowledgement missing."
-        )
-
-    if tool_name == "list_categories":
-        categories = output.get("categories")
-        if isinstance(categories, list):
-            return VerificationResult(True, f"Returned {len(categories)} categories.")
-        return VerificationResult(False, "Missing categories list.")
-
-    if tool_name == "upsert_category":
-        category = output.get("category")
-        if category and category.get("id"):
-            return VerificationResult(True, f"Category saved ({category.get('name', 'unnamed')}).")
-        return VerificationResult(False, "Category payload missing id.")
-
-    if tool_name == "delete_category":
-        return VerificationResult(True, f"Deleted {output.get('deleted')}.") if output.get("deleted") else VerificationResult(
-            False, "Delete acknowledgement missing."
-        )
-
-    return VerificationResult(True, "Ran without explicit verifier.")
+    verifier = _VERIFIERS.get(tool_name)
+    if verifier is None:
+        return VerificationResult(True, "Ran without explicit verifier.")
+    return verifier(output)
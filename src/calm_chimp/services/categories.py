@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from time import monotonic
 from typing import Optional
 from uuid import uuid4
 
@@ -11,10 +12,26 @@ from .context import ServiceContext
 @dataclass(slots=True)
 class CategoryService:
     context: ServiceContext
+    # (user_id, expires_at, categories) for the last listing, reused until the refresh interval passes.
+    _listing: Optional[tuple[str, float, list[Category]]] = field(default=None, init=False)
+    # Bumped by invalidate() so a fetch that raced a write does not store its stale listing.
+    _generation: int = field(default=0, init=False)
 
     def list_categories(self) -> list[Category]:
         user_id = self.context.gateway.current_user_id()
-        return self.context.categories.list_for_user(user_id)
+        listing = self._listing
+        if listing and listing[0] == user_id and monotonic() < listing[1]:
+            return list(listing[2])
+        generation = self._generation
+        categories = self.context.categories.list_for_user(user_id)
+        if self._generation == generation:
+            ttl = self.context.settings.cache.refresh_interval.total_seconds()
+            self._listing = (user_id, monotonic() + ttl, categories)
+        return list(categories)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._listing = None
 
     def upsert_category(
         self,
@@ -34,10 +51,15 @@ class CategoryService:
             icon=icon,
             description=description,
         )
-        return self.context.categories.upsert(category)
+        saved = self.context.categories.upsert(category)
+        self.invalidate()
+        return saved
 
     def delete_category(self, category_id: str) -> bool:
-        return self.context.categories.delete(category_id)
+        deleted = self.context.categories.delete(category_id)
+        if deleted:
+            self.invalidate()
+        return deleted
 
     def fetch(self, category_id: str) -> Optional[Category]:
         return self.context.categories.fetch(category_id)
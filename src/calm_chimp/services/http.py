@@ -1,21 +1,41 @@
 from __future__ import annotations
 
-import asyncio
-from typing import Any, Dict
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict
 
-from fastapi import FastAPI, HTTPException
-from hypercorn.asyncio import serve
-from hypercorn.config import Config
+import orjson
+import uvicorn
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from ..api import call_api, get_api_functions
+from ..api import ApiFunction, call_api, get_api_functions
 
-app = FastAPI(title="Calm Chimp API", version="1.0.0")
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Sync handlers run on anyio worker threads; the default cap of 40 would queue
+    # concurrent Supabase-bound tool calls. Each extra thread costs roughly one stack.
+    to_thread.current_default_thread_limiter().total_tokens = max(200, 32 * (os.cpu_count() or 1))
+    yield
 
-@app.get("/api/functions")
-def list_functions() -> Dict[str, Any]:
+
+app = FastAPI(
+    title="Calm Chimp API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@lru_cache(maxsize=1)
+def _functions_body(specs: tuple[ApiFunction, ...]) -> bytes:
     functions = []
-    for spec in get_api_functions():
+    for spec in specs:
         functions.append(
             {
                 "name": spec.name,
@@ -25,11 +45,17 @@ def list_functions() -> Dict[str, Any]:
                 "parameters": spec.parameters,
             }
         )
-    return {"functions": functions}
+    return orjson.dumps({"functions": functions})
 
 
-@app.post("/api/functions/{name}")
-def invoke_function(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+@app.get("/api/functions")
+def list_functions() -> Response:
+    # The registry only changes on registration, which yields a new specs tuple and a fresh body.
+    return Response(_functions_body(get_api_functions()), media_type="application/json")
+
+
+@app.post("/api/functions/{name}", response_model=None)
+def invoke_function(name: str, payload: dict) -> Dict[str, Any]:
     arguments = payload.get("arguments") or {}
     if not isinstance(arguments, dict):
         raise HTTPException(status_code=400, detail="arguments must be an object")
@@ -42,11 +68,6 @@ def invoke_function(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     return {"result": result}
 
 
-async def _serve(config: Config) -> None:
-    await serve(app, config)
-
-
 def run_local_server(host: str = "127.0.0.1", port: int = 8000) -> None:
-    config = Config()
-    config.bind = [f"{host}:{port}"]
-    asyncio.run(_serve(config))
+    # "auto" picks uvloop and httptools when they are installed (they ship with uvicorn[standard]).
+    uvicorn.run(app, host=host, port=port, loop="auto", http="auto", log_level="warning", access_log=False)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastmcp.server import FastMCP
 from fastmcp.tools import FunctionTool
 
@@ -7,15 +9,15 @@ from ..api import get_api_functions
 
 
 def build_mcp_server(host: str = "127.0.0.1", port: int = 8765) -> FastMCP:
-    tools = []
-    for spec in get_api_functions():
-        tool = FunctionTool.from_function(
+    tools = [
+        FunctionTool.from_function(
             spec.func,
             name=spec.name,
             description=spec.description,
             tags=set(spec.tags),
         )
-        tools.append(tool)
+        for spec in get_api_functions()
+    ]
     return FastMCP(
         name="Calm Chimp MCP",
         instructions="Deterministic Supabase calendar tools.",
@@ -26,6 +28,15 @@ def build_mcp_server(host: str = "127.0.0.1", port: int = 8765) -> FastMCP:
     )
 
 
+def _use_uvloop() -> None:
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def run_mcp_server(host: str = "127.0.0.1", port: int = 8765) -> None:
+    _use_uvloop()
     server = build_mcp_server(host=host, port=port)
     server.run("streamable-http")
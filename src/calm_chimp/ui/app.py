@@ -7,7 +7,6 @@ from ..api import api_state
 from ..bootstrap import configure_logging
 from ..config import AppPalette, get_settings
 from .login import LoginDialog
-from .main_window import MainWindow
 from .styles.theme import apply_palette
 
 
@@ -21,6 +20,9 @@ def run_gui() -> None:
     if login.exec() != LoginDialog.DialogCode.Accepted:
         return
 
+    # The main window pulls in the orchestrator and LLM client; keep that off the login path.
+    from .main_window import MainWindow
+
     window = MainWindow(api_state=api_state, settings=settings)
     window.show()
     sys.exit(app.exec())
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Iterable
+from typing import Any, Iterable, Optional
 
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractListModel, QDate, QModelIndex, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QVBoxLayout, QWidget, QCalendarWidget
+from PyQt6.QtWidgets import QLabel, QListView, QVBoxLayout, QWidget, QCalendarWidget
 
 from ...domain import CalendarEvent, EventStatus
 
@@ -18,6 +18,56 @@ _STATUS_COLORS = {
 }
 
 
+EventRow = tuple[str, CalendarEvent]
+
+
+def _event_label(event: CalendarEvent) -> str:
+    label = f"{event.starts_at.strftime('%H:%M')} — {event.title}"
+    if event.category and event.category.name:
+        label += f"  ·  {event.category.name}"
+    return label
+
+
+def event_rows(events: Iterable[CalendarEvent]) -> list[EventRow]:
+    """Pre-render list labels; call from worker threads so painting only reads strings."""
+
+    return [(_event_label(event), event) for event in events]
+
+
+class _EventListModel(QAbstractListModel):
+    """Read-only list model over the events shown for the selected day."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rows: list[EventRow] = []
+
+    @property
+    def rows(self) -> list[EventRow]:
+        return self._rows
+
+    def set_rows(self, rows: list[EventRow]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        label, event = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return label
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return QColor(_STATUS_COLORS.get(event.status, "#f8fafc"))
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return event.notes or ""
+        if role == Qt.ItemDataRole.UserRole:
+            return event
+        return None
+
+
 class CalendarPanel(QWidget):
     day_changed = pyqtSignal(str)
     event_selected = pyqtSignal(object)
@@ -35,41 +85,57 @@ class CalendarPanel(QWidget):
 
         self.calendar_widget = QCalendarWidget()
         self.calendar_widget.setGridVisible(False)
-        self.calendar_widget.selectionChanged.connect(self._emit_day_change)
         layout.addWidget(self.calendar_widget)
 
+        # Arrow-key holds and drags fire selectionChanged in bursts; only the settled day is loaded.
+        self._day_debounce = QTimer(self)
+        self._day_debounce.setSingleShot(True)
+        self._day_debounce.setInterval(150)
+        self._day_debounce.timeout.connect(self._emit_day_change)
+        self.calendar_widget.selectionChanged.connect(self._day_debounce.start)
+        self._emitted_day: Optional[str] = None
+
         layout.addWidget(QLabel("Events"))
-        self.event_list = QListWidget()
-        self.event_list.itemSelectionChanged.connect(self._on_event_selected)
+        self.event_model = _EventListModel()
+        self.event_list = QListView()
+        self.event_list.setModel(self.event_model)
+        self.event_list.setUniformItemSizes(True)
+        self.event_list.selectionModel().currentChanged.connect(self._on_event_selected)
         layout.addWidget(self.event_list, stretch=1)
 
         self.set_day(date.today())
 
     def set_day(self, day: date) -> None:
+        if self._day_debounce.isActive():
+            # The user picked another day that has not been emitted yet; a late result for the
+            # previous day must not move the selection back and swallow that pick.
+            return
+        self._emitted_day = day.isoformat()
         self.date_label.setText(day.strftime("%A, %d %B %Y"))
-        self.calendar_widget.setSelectedDate(QDate(day.year, day.month, day.day))
-
-    def populate_events(self, events: Iterable[CalendarEvent]) -> None:
-        self.event_list.clear()
-        for event in events:
-            label = f"{event.starts_at.strftime('%H:%M')} — {event.title}"
-            if event.category and event.category.name:
-                label += f"  ·  {event.category.name}"
-            item = QListWidgetItem(label)
-            color = _STATUS_COLORS.get(event.status, "#f8fafc")
-            item.setForeground(QColor(color))
-            item.setData(Qt.ItemDataRole.UserRole, event)
-            item.setToolTip(event.notes or "")
-            self.event_list.addItem(item)
+        # Programmatic selection must not arm the debounce; only user picks should.
+        self.calendar_widget.blockSignals(True)
+        try:
+            self.calendar_widget.setSelectedDate(QDate(day.year, day.month, day.day))
+        finally:
+            self.calendar_widget.blockSignals(False)
+
+    def populate_events(self, rows: list[EventRow]) -> None:
+        if rows == self.event_model.rows:
+            # Refreshes usually return the same rows; skip resetting the model.
+            return
+        self.event_model.set_rows(rows)
 
     def _emit_day_change(self) -> None:
         qdate = self.calendar_widget.selectedDate()
         iso = qdate.toString("yyyy-MM-dd")
-        self.day_changed.emit(iso)
         self.date_label.setText(qdate.toString("dddd, dd MMMM yyyy"))
+        if iso == self._emitted_day:
+            return
+        self._emitted_day = iso
+        self.day_changed.emit(iso)
 
-    def _on_event_selected(self) -> None:
-        item = self.event_list.currentItem()
-        if not item:
+    def _on_event_selected(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        event: Optional[CalendarEvent] = current.data(Qt.ItemDataRole.UserRole)
+        if event is None:
             return
-        self.event_selected.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.event_selected.emit(event)
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import json
 import html
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, List
 
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QVBoxLayout, QWidget, QLabel
 
 from ...orchestrator import LangGraphOrchestrator
 from ...utils.qt import TaskRunner
 
+# Oldest whole messages are dropped past this point so long sessions keep a bounded document.
+_TRANSCRIPT_MAX_MESSAGES = 500
+
 
 class ChatPanel(QWidget):
     tool_executed = pyqtSignal(str, dict, dict)
@@ -19,7 +24,9 @@ class ChatPanel(QWidget):
         self.setObjectName("chatPanel")
         self.orchestrator = orchestrator
         self.runner = runner
-        self.history: List[Dict[str, str]] = []
+        # Only the orchestrator's history window is ever sent, so older turns are not kept.
+        limit = orchestrator.settings.llm.history_limit
+        self.history: Deque[Dict[str, str]] = deque(maxlen=limit if limit > 0 else None)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -35,6 +42,9 @@ class ChatPanel(QWidget):
         self.transcript = QTextEdit()
         self.transcript.setObjectName("chatTranscript")
         self.transcript.setReadOnly(True)
+        # Block count of every message still in the transcript, oldest first; a message with a
+        # <pre> tool result spans one block per line.
+        self._message_blocks: Deque[int] = deque()
         self.transcript.setPlaceholderText("Ask the Calm Chimp assistant to plan or summarize events...")
         layout.addWidget(self.transcript)
 
@@ -50,8 +60,45 @@ class ChatPanel(QWidget):
         layout.addLayout(input_row)
 
     def append_message(self, role: str, content: str) -> None:
+        self._append_html([self._message_html(role, content)])
+
+    @staticmethod
+    def _message_html(role: str, content: str) -> str:
         prefix = "You" if role == "user" else "Assistant"
-        self.transcript.append(f"<b>{prefix}:</b> {content}")
+        return f"<b>{prefix}:</b> {content}"
+
+    def _append_html(self, fragments: List[str]) -> None:
+        # One edit block per batch, so the document relayouts once instead of once per fragment.
+        # A detached cursor leaves the user's selection alone, and the view only follows new
+        # messages when it was already at the bottom.
+        scrollbar = self.transcript.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        document = self.transcript.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        try:
+            for fragment in fragments:
+                if not document.isEmpty():
+                    cursor.insertBlock()
+                first_block = cursor.blockNumber()
+                cursor.insertHtml(fragment)
+                self._message_blocks.append(cursor.blockNumber() - first_block + 1)
+            self._trim_transcript(cursor)
+        finally:
+            cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _trim_transcript(self, cursor: QTextCursor) -> None:
+        excess = len(self._message_blocks) - _TRANSCRIPT_MAX_MESSAGES
+        if excess <= 0:
+            return
+        dropped = sum(self._message_blocks.popleft() for _ in range(excess))
+        # Remove everything before the first block of the oldest kept message.
+        cursor.setPosition(0)
+        cursor.setPosition(cursor.document().findBlockByNumber(dropped).position(), QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
 
     def _send(self) -> None:
         message = self.input_line.text().strip()
@@ -61,15 +108,17 @@ class ChatPanel(QWidget):
         self.append_message("user", message)
         self.history.append({"role": "user", "content": message})
         self.input_line.setEnabled(False)
+        history = list(self.history)
 
         def worker() -> Dict[str, Any]:
-            return self.orchestrator.invoke(self.history, message)
+            return self.orchestrator.invoke(history, message)
 
         def done(result: Dict[str, Any]) -> None:
             self.input_line.setEnabled(True)
+            fragments: List[str] = []
             messages = result.get("messages", [])
             for text in messages:
-                self.append_message("assistant", text)
+                fragments.append(self._message_html("assistant", text))
                 self.history.append({"role": "assistant", "content": text})
             tool_name = result.get("tool_name")
             if tool_name:
@@ -79,7 +128,10 @@ class ChatPanel(QWidget):
                     pretty = html.escape(json.dumps(output, indent=2))
                 else:
                     pretty = "No data returned."
-                self.append_message("assistant", f"`{tool_name}` result:<br><pre>{pretty}</pre>")
+                fragments.append(self._message_html("assistant", f"`{tool_name}` result:<br><pre>{pretty}</pre>"))
+            if fragments:
+                self._append_html(fragments)
+            if tool_name:
                 self.tool_executed.emit(tool_name, arguments, output or {})
 
         def fail(exc: Exception) -> None:
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QVBoxLayout,
     QWidget,
@@ -17,6 +16,34 @@ from PyQt6.QtWidgets import (
 from ...domain import Category
 
 
+class _CategoryListModel(QAbstractListModel):
+    """Read-only list model over the user's categories."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rows: list[tuple[Category, QColor]] = []
+
+    def set_categories(self, categories: list[Category]) -> None:
+        self.beginResetModel()
+        self._rows = [(category, QColor(category.color or "#4cc9f0")) for category in categories]
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        category, color = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return category.name
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return color
+        if role == Qt.ItemDataRole.UserRole:
+            return category
+        return None
+
+
 class Sidebar(QWidget):
     category_selected = pyqtSignal(object)
     create_category_requested = pyqtSignal()
@@ -49,8 +76,11 @@ class Sidebar(QWidget):
         categories_label = QLabel("Categories")
         categories_label.setObjectName("caption")
         layout.addWidget(categories_label)
-        self.category_list = QListWidget()
-        self.category_list.itemSelectionChanged.connect(self._emit_selected_category)
+        self.category_model = _CategoryListModel()
+        self.category_list = QListView()
+        self.category_list.setModel(self.category_model)
+        self.category_list.setUniformItemSizes(True)
+        self.category_list.selectionModel().selectionChanged.connect(self._emit_selected_category)
         layout.addWidget(self.category_list, stretch=1)
 
         add_category = QPushButton("New Category")
@@ -59,6 +89,8 @@ class Sidebar(QWidget):
 
         layout.addStretch(1)
 
+        self._shown_categories: list[Category] = []
+
     def set_user(self, *, email: str, full_name: Optional[str]) -> None:
         if full_name:
             text = f"<b>{full_name}</b><br><span style='color:#94a3b8'>{email}</span>"
@@ -67,17 +99,19 @@ class Sidebar(QWidget):
         self.user_label.setText(text)
 
     def set_categories(self, categories: Iterable[Category]) -> None:
-        self.category_list.clear()
-        for category in categories:
-            item = QListWidgetItem(category.name)
-            item.setData(Qt.ItemDataRole.UserRole, category)
-            color = QColor(category.color or "#4cc9f0")
-            item.setForeground(color)
-            self.category_list.addItem(item)
+        categories = list(categories)
+        if categories == self._shown_categories:
+            return
+        self._shown_categories = categories
+        had_selection = self.category_list.selectionModel().hasSelection()
+        self.category_model.set_categories(categories)
+        if had_selection:
+            # A model reset drops the selection silently; clear the event filter explicitly.
+            self.category_selected.emit(None)
 
     def _emit_selected_category(self) -> None:
-        item = self.category_list.currentItem()
-        if not item:
+        selected = self.category_list.selectionModel().selectedIndexes()
+        if not selected:
             self.category_selected.emit(None)
             return
-        self.category_selected.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.category_selected.emit(selected[0].data(Qt.ItemDataRole.UserRole))
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import socket
 import threading
-import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
-from PyQt6.QtCore import Qt, QRectF, QSize, QPointF
+from PyQt6.QtCore import Qt, QObject, QRectF, QSize, QPointF, QTimer, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -19,7 +18,7 @@ from PyQt6.QtWidgets import (
     QSpacerItem,
     QVBoxLayout,
 )
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QPen, QColor
+from PyQt6.QtGui import QDesktopServices, QIcon, QPixmap, QPainter, QPen, QColor
 
 from ..assets import asset_path
 from ..config.settings import SupabaseSettings
@@ -27,51 +26,70 @@ from ..services import AuthService
 from ..utils.qt import TaskRunner
 
 
+_OAUTH_TIMEOUT_MS = 120_000
+_CALLBACK_OK_BODY = b"<html><body><h2>Authentication complete. You may close this window.</h2></body></html>"
+_CALLBACK_ERROR_BODY = b"<html><body><h2>Authentication failed.</h2></body></html>"
+
+
+class _OAuthSignals(QObject):
+    # Emitted from the server's request thread; Qt queues delivery onto the dialog's thread.
+    callback_received = pyqtSignal(object, object)
+
+
 class _OAuthHandler(BaseHTTPRequestHandler):
-    code: Optional[str] = None
-    error: Optional[str] = None
-    event = threading.Event()
+    server: _OAuthServer
+    disable_nagle_algorithm = True
 
     def do_GET(self):  # noqa: N802
         parsed = urlparse(self.path)
+        if parsed.path != "/auth/callback":
+            # Browsers follow up with favicon and similar requests; they must not clobber the code.
+            # Answer with a bare status line rather than send_error's formatted HTML page.
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
         params = parse_qs(parsed.query)
-        _OAuthHandler.code = (params.get("code") or [None])[0]
-        _OAuthHandler.error = (params.get("error") or [None])[0]
-        message = "Authentication complete. You may close this window." if not _OAuthHandler.error else "Authentication failed."
+        code = (params.get("code") or [None])[0]
+        error = (params.get("error") or [None])[0]
+        body = _CALLBACK_ERROR_BODY if error else _CALLBACK_OK_BODY
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(f"<html><body><h2>{message}</h2></body></html>".encode("utf-8"))
-        _OAuthHandler.event.set()
+        self.wfile.write(body)
+        self.server.signals.callback_received.emit(code, error)
 
     def log_message(self, fmt: str, *args):  # noqa: D401
         """Silence default request logging."""
 
 
-def _reset_oauth_state() -> None:
-    _OAuthHandler.code = None
-    _OAuthHandler.error = None
-    _OAuthHandler.event.clear()
+class _OAuthServer(ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
 
+    def __init__(self, address: tuple[str, int], signals: _OAuthSignals) -> None:
+        self.signals = signals
+        super().__init__(address, _OAuthHandler)
 
-def _find_port(preferred: int) -> int:
+
+def _start_oauth_server(preferred_port: int, signals: _OAuthSignals) -> _OAuthServer:
+    # Bind the listener directly instead of probing first, so the port cannot be taken in between.
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.bind(("127.0.0.1", preferred))
-            return sock.getsockname()[1]
+        server = _OAuthServer(("127.0.0.1", preferred_port), signals)
     except OSError:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.bind(("127.0.0.1", 0))
-            return sock.getsockname()[1]
-
-
-def _start_oauth_server(port: int) -> HTTPServer:
-    server = HTTPServer(("127.0.0.1", port), _OAuthHandler)
+        server = _OAuthServer(("127.0.0.1", 0), signals)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     return server
 
 
+def _stop_oauth_server(server: _OAuthServer) -> None:
+    server.shutdown()
+    server.server_close()
+
+
+@lru_cache(maxsize=8)
 def _google_icon(size: int = 22) -> QIcon:
     pix = QPixmap(size, size)
     pix.fill(Qt.GlobalColor.transparent)
@@ -99,6 +117,15 @@ def _google_icon(size: int = 22) -> QIcon:
     return QIcon(pix)
 
 
+@lru_cache(maxsize=4)
+def _branding_logo(size: int) -> QPixmap:
+    # Decoded and scaled once per process; reopening the dialog reuses the pixmap.
+    pix = QPixmap(asset_path("branding/calm-chimp-logo.webp"))
+    if pix.isNull():
+        return pix
+    return pix.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
 class LoginDialog(QDialog):
     def __init__(self, *, auth_service: AuthService, supabase_settings: SupabaseSettings) -> None:
         super().__init__()
@@ -135,9 +162,9 @@ class LoginDialog(QDialog):
 
         logo = QLabel()
         logo.setObjectName("brandLogo")
-        logo_pix = QPixmap(asset_path("branding/calm-chimp-logo.webp"))
+        logo_pix = _branding_logo(72)
         if not logo_pix.isNull():
-            logo.setPixmap(logo_pix.scaled(72, 72, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            logo.setPixmap(logo_pix)
         logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         logo_badge_layout.addWidget(logo, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -214,7 +241,18 @@ class LoginDialog(QDialog):
         footer.addWidget(cancel)
         layout.addLayout(footer)
 
+        # Started on the first Google click and reused by retries until the dialog closes.
+        self._oauth_server: Optional[_OAuthServer] = None
+        self._oauth_signals = _OAuthSignals(self)
+        self._oauth_signals.callback_received.connect(self._on_oauth_callback)
+        # The callback is awaited on the event loop, so no pool thread blocks for the round-trip.
+        self._oauth_timeout = QTimer(self)
+        self._oauth_timeout.setSingleShot(True)
+        self._oauth_timeout.setInterval(_OAUTH_TIMEOUT_MS)
+        self._oauth_timeout.timeout.connect(self._on_oauth_timeout)
+        self._awaiting_oauth = False
         self._action_buttons = [google_btn]
+        self._busy = False
         self._status_kind = "info"
         self._default_status = "Continue with Google to connect your cloud workspace."
         self._set_status(self._default_status)
@@ -223,29 +261,27 @@ class LoginDialog(QDialog):
     # ------------------------------------------------------------------ helpers
 
     def _set_status(self, message: str, *, kind: str = "info") -> None:
+        label = self.status_label
+        # Repeated identical statuses (e.g. retry clicks) skip the text update and re-polish.
+        if kind == self._status_kind and message == label.text() and label.isHidden() != bool(message):
+            return
         self._status_kind = kind
         if not message:
-            self.status_label.hide()
+            label.hide()
             return
 
-        styles = {
-            "info": ("#e0e7ff", "#111a2e", "#1f2a44"),
-            "success": ("#4ade80", "#11261a", "#1f3d29"),
-            "error": ("#f87171", "#2e1114", "#4e1c22"),
-        }
-        color, background, border = styles.get(kind, styles["info"])
-        stylesheet = (
-            f"color: {color};"
-            f"background-color: {background};"
-            f"border: 1px solid {border};"
-            "padding: 8px 12px;"
-            "border-radius: 6px;"
-        )
-        self.status_label.setStyleSheet(stylesheet)
-        self.status_label.setText(message)
-        self.status_label.show()
+        # Colors come from the app stylesheet's [kind=...] selectors; re-polish to pick up the change.
+        if label.property("kind") != kind:
+            label.setProperty("kind", kind)
+            label.style().unpolish(label)
+            label.style().polish(label)
+        label.setText(message)
+        label.show()
 
     def _set_busy(self, busy: bool) -> None:
+        if busy == self._busy:
+            return
+        self._busy = busy
         for widget in self._action_buttons:
             widget.setEnabled(not busy)
 
@@ -261,39 +297,72 @@ class LoginDialog(QDialog):
         self._set_status("Authentication successful.", kind="success")
         self.accept()
 
+    def _ensure_oauth_server(self) -> _OAuthServer:
+        if self._oauth_server is None:
+            self._oauth_server = _start_oauth_server(self.supabase_settings.redirect_port, self._oauth_signals)
+        return self._oauth_server
+
+    def _stop_waiting(self) -> bool:
+        was_waiting, self._awaiting_oauth = self._awaiting_oauth, False
+        self._oauth_timeout.stop()
+        return was_waiting
+
+    def done(self, result: int) -> None:
+        self._stop_waiting()
+        server, self._oauth_server = self._oauth_server, None
+        if server is not None:
+            # shutdown() waits for the serve loop's poll interval; keep that off the GUI thread.
+            self.runner.submit(_stop_oauth_server, server)
+        super().done(result)
+
     # ------------------------------------------------------------------ slots
 
+    @pyqtSlot()
     def _sign_in_google(self) -> None:
         if not self.supabase_settings.is_configured:
             self._set_status("Supabase credentials missing. Set SUPABASE_URL and SUPABASE_ANON_KEY.", kind="error")
             return
-        port = _find_port(self.supabase_settings.redirect_port)
-        redirect_url = f"http://localhost:{port}/auth/callback"
-        server = _start_oauth_server(port)
-        _reset_oauth_state()
+        server = self._ensure_oauth_server()
+        redirect_url = f"http://localhost:{server.server_address[1]}/auth/callback"
         self._set_status("Waiting for Google OAuth...", kind="info")
+        self._awaiting_oauth = True
+        self._oauth_timeout.start()
 
-        def worker() -> object:
+        def worker() -> Optional[str]:
             response = self.auth_service.sign_in_with_oauth("google", redirect_to=redirect_url)
-            url = getattr(response, "url", None)
-            if url:
-                webbrowser.open(url)
-            _OAuthHandler.event.wait(timeout=120)
-            if _OAuthHandler.error:
-                raise RuntimeError(_OAuthHandler.error)
-            if not _OAuthHandler.code:
-                raise RuntimeError("No OAuth code received.")
-            session = self.auth_service.exchange_code_for_session(_OAuthHandler.code)
-            if session is None:
-                raise RuntimeError("Failed to exchange OAuth code for session.")
-            return session
+            return getattr(response, "url", None)
 
-        def finalize(result: object) -> None:
-            server.shutdown()
-            self._finish_sign_in(result)
+        def open_browser(url: Optional[str]) -> None:
+            # Qt hands the URL to the desktop launcher without blocking on xdg-open.
+            if url and self._awaiting_oauth:
+                QDesktopServices.openUrl(QUrl(url))
 
         def fail(exc: Exception) -> None:
-            server.shutdown()
+            self._stop_waiting()
             self._handle_error(exc)
 
-        self.runner.submit(worker, on_success=finalize, on_error=fail)
+        self.runner.submit(worker, on_success=open_browser, on_error=fail)
+
+    @pyqtSlot(object, object)
+    def _on_oauth_callback(self, code: Optional[str], error: Optional[str]) -> None:
+        if not self._stop_waiting():
+            return
+        if error:
+            self._handle_error(RuntimeError(error))
+            return
+        if not code:
+            self._handle_error(RuntimeError("No OAuth code received."))
+            return
+
+        def worker() -> object:
+            session = self.auth_service.exchange_code_for_session(code)
+            if session is None:
+                raise RuntimeError("Failed to exchange OAuth code for session.")
+            return session
+
+        self.runner.submit(worker, on_success=self._finish_sign_in, on_error=self._handle_error)
+
+    @pyqtSlot()
+    def _on_oauth_timeout(self) -> None:
+        if self._stop_waiting():
+            self._handle_error(RuntimeError("No OAuth code received."))
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtWidgets import QMainWindow, QMessageBox, QSplitter
 
-from ..api import api_state
+from ..api import TIMELINE_MUTATING_TOOLS, api_state
 from ..config.settings import AppSettings
 from ..domain import CalendarEvent, Category
 from ..orchestrator import LangGraphOrchestrator
 from ..utils.qt import TaskRunner
-from .components.calendar_panel import CalendarPanel
+from .components.calendar_panel import CalendarPanel, EventRow, event_rows
 from .components.category_dialog import CategoryDialog
 from .components.chat_panel import ChatPanel
 from .components.event_dialog import EventDialog
@@ -43,8 +43,9 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(2, 2)
 
         self.setCentralWidget(splitter)
+        self.status_bar = self.statusBar()
 
-        self.sidebar.refresh_requested.connect(self.refresh_timeline)
+        self.sidebar.refresh_requested.connect(self.reload_all)
         self.sidebar.create_category_requested.connect(self.create_category)
         self.sidebar.new_event_requested.connect(self.create_event)
         self.sidebar.category_selected.connect(self.filter_by_category)
@@ -54,51 +55,83 @@ class MainWindow(QMainWindow):
 
         self._categories: List[Category] = []
         self._selected_day: date = date.today()
+        # Bumped for every event-list load so late results from older loads are dropped.
+        self._events_request = 0
+        # Rows of the last day loaded, plus the same rows bucketed by category id for filtering.
+        self._day_rows: tuple[Optional[date], List[EventRow]] = (None, [])
+        self._day_rows_by_category: Dict[Optional[str], List[EventRow]] = {}
+        self._active_category: Optional[Category] = None
+        self._refresh_running = False
+        self._refresh_queued = False
         self._initialize_ui()
 
     # ------------------------------------------------------------------ boot
 
     def _initialize_ui(self) -> None:
-        self.statusBar().showMessage("Loading Supabase data...")
+        # refresh_timeline posts the loading message; an earlier one here would be overwritten unpainted.
         self.load_profile()
         self.refresh_timeline()
 
     # ------------------------------------------------------------------ data fetchers
 
     def load_profile(self) -> None:
-        def worker():
+        def worker() -> tuple[str, Optional[str]]:
             user_id = self.api_state.context.gateway.current_user_id()
             profile = self.api_state.context.profiles.fetch(user_id)
             if profile:
-                return profile
+                return profile.email, profile.full_name
             session = self.api_state.context.gateway.session()
             email = getattr(getattr(session, "user", None), "email", "")
-            return {"email": email, "full_name": None}
-
-        def done(result):
-            if hasattr(result, "email"):
-                email = getattr(result, "email")
-                full_name = getattr(result, "full_name", None)
-            else:
-                email = result.get("email")
-                full_name = result.get("full_name")
+            return email, None
+
+        def done(result: tuple[str, Optional[str]]) -> None:
+            email, full_name = result
             self.sidebar.set_user(email=email, full_name=full_name)
 
         self.runner.submit(worker, on_success=done, on_error=self._handle_error)
 
+    @pyqtSlot()
+    def reload_all(self) -> None:
+        # An explicit refresh bypasses the short-lived category listing cache.
+        self.api_state.categories.invalidate()
+        self.refresh_timeline()
+
     def refresh_timeline(self) -> None:
-        self.statusBar().showMessage("Refreshing timeline cache…")
+        if self._refresh_running:
+            # Collapse refreshes requested mid-flight into a single follow-up run.
+            self._refresh_queued = True
+            return
+        self._refresh_running = True
+        self.status_bar.showMessage("Refreshing timeline cache…")
+        target_date = self._selected_day
+        request = self._next_events_request()
 
-        def worker():
+        def worker() -> tuple[List[Category], List[EventRow]]:
+            # Categories and the visible day ride along with the refresh instead of two follow-up jobs.
             self.api_state.calendar.prime_cache()
-            return self.api_state.calendar.cache
+            categories = self.api_state.categories.list_categories()
+            return categories, event_rows(self.api_state.calendar.list_for_day(target_date))
 
-        def done(_cache):
-            self.statusBar().showMessage("Timeline synchronized.", 4000)
-            self.load_categories()
-            self.load_day(self._selected_day.isoformat())
+        def done(result: tuple[List[Category], List[EventRow]]) -> None:
+            self._finish_refresh()
+            self.status_bar.showMessage("Timeline synchronized.", 4000)
+            categories, rows = result
+            self._categories = categories
+            self.sidebar.set_categories(categories)
+            if request == self._events_request:
+                self._show_day_rows(target_date, rows)
 
-        self.runner.submit(worker, on_success=done, on_error=self._handle_error)
+        def fail(exc: Exception) -> None:
+            self._finish_refresh()
+            self._handle_error(exc)
+
+        self.runner.submit(worker, on_success=done, on_error=fail)
+
+    def _finish_refresh(self) -> None:
+        self._refresh_running = False
+        if self._refresh_queued:
+            self._refresh_queued = False
+            QTimer.singleShot(0, self.refresh_timeline)
 
     def load_categories(self) -> None:
         def worker():
@@ -110,38 +143,41 @@ class MainWindow(QMainWindow):
 
         self.runner.submit(worker, on_success=done, on_error=self._handle_error)
 
+    @pyqtSlot(str)
     def load_day(self, day_iso: str) -> None:
         try:
             target_date = date.fromisoformat(day_iso)
         except ValueError:
             target_date = date.today()
         self._selected_day = target_date
+        request = self._next_events_request()
 
-        def worker() -> List[CalendarEvent]:
-            return self.api_state.calendar.list_for_day(target_date)
+        def worker() -> List[EventRow]:
+            return event_rows(self.api_state.calendar.list_for_day(target_date))
 
-        def done(events: List[CalendarEvent]) -> None:
-            self.calendar_panel.set_day(target_date)
-            self.calendar_panel.populate_events(events)
+        def done(rows: List[EventRow]) -> None:
+            if request != self._events_request:
+                return
+            self._show_day_rows(target_date, rows)
 
         self.runner.submit(worker, on_success=done, on_error=self._handle_error)
 
     # ------------------------------------------------------------------ actions
 
+    @pyqtSlot(object)
     def filter_by_category(self, category: Optional[Category]) -> None:
-        if not category:
+        # Remembered so a load that lands after the selection still shows the filtered view.
+        self._active_category = category
+        day, rows = self._day_rows
+        if day != self._selected_day:
+            # The selected day is still loading (or failed to); its completion applies the filter.
             self.load_day(self._selected_day.isoformat())
             return
+        # The selected day's rows are already in memory; filtering needs no worker round-trip
+        # and must not invalidate a load that is still pending.
+        self.calendar_panel.populate_events(self._filtered_day_rows())
 
-        def worker() -> List[CalendarEvent]:
-            events = self.api_state.calendar.list_for_day(self._selected_day)
-            return [event for event in events if event.category_id == category.id]
-
-        def done(events: List[CalendarEvent]) -> None:
-            self.calendar_panel.populate_events(events)
-
-        self.runner.submit(worker, on_success=done, on_error=self._handle_error)
-
+    @pyqtSlot()
     def create_category(self) -> None:
         dialog = CategoryDialog()
         if dialog.exec() != CategoryDialog.DialogCode.Accepted:
@@ -156,10 +192,11 @@ class MainWindow(QMainWindow):
 
         def done(_category: Category) -> None:
             self.load_categories()
-            self.statusBar().showMessage("Category saved.", 3000)
+            self.status_bar.showMessage("Category saved.", 3000)
 
         self.runner.submit(worker, on_success=done, on_error=self._handle_error)
 
+    @pyqtSlot()
     def create_event(self) -> None:
         start = datetime.combine(self._selected_day, datetime.now().time()).replace(hour=9, minute=0, second=0)
         end = start + timedelta(hours=1)
@@ -176,25 +213,48 @@ class MainWindow(QMainWindow):
             return self.api_state.calendar.upsert_event(title=title, **values)
 
         def done(_event: CalendarEvent) -> None:
-            self.statusBar().showMessage("Event saved.", 3000)
-            self.refresh_timeline()
+            # upsert_event already wrote the saved event into the timeline cache.
+            self.status_bar.showMessage("Event saved.", 3000)
+            self.load_day(self._selected_day.isoformat())
 
         self.runner.submit(worker, on_success=done, on_error=self._handle_error)
 
     # ------------------------------------------------------------------ chat integration
 
+    @pyqtSlot(str, dict, dict)
     def _handle_tool_execution(self, tool_name: str, arguments: dict, output: dict) -> None:
-        if tool_name in {"refresh_timeline", "upsert_event", "delete_event"}:
-            self.refresh_timeline()
+        # The tools update the shared timeline cache themselves, so only the affected view reloads.
+        if tool_name in TIMELINE_MUTATING_TOOLS:
+            self.load_day(self._selected_day.isoformat())
         elif tool_name == "events_for_day":
             day = arguments.get("day") or output.get("day")
             if day:
                 self.load_day(day)
-        elif tool_name == "list_categories":
+        elif tool_name in {"list_categories", "upsert_category", "delete_category"}:
             self.load_categories()
 
     # ------------------------------------------------------------------ misc
 
+    def _show_day_rows(self, day: date, rows: List[EventRow]) -> None:
+        # Only called for the current events request, so older loads never replace the buckets.
+        buckets: Dict[Optional[str], List[EventRow]] = {}
+        for row in rows:
+            buckets.setdefault(row[1].category_id, []).append(row)
+        self._day_rows = (day, rows)
+        self._day_rows_by_category = buckets
+        self.calendar_panel.set_day(day)
+        self.calendar_panel.populate_events(self._filtered_day_rows())
+
+    def _filtered_day_rows(self) -> List[EventRow]:
+        category = self._active_category
+        if category is None:
+            return self._day_rows[1]
+        return self._day_rows_by_category.get(category.id, [])
+
+    def _next_events_request(self) -> int:
+        self._events_request += 1
+        return self._events_request
+
     def _handle_error(self, exc: Exception) -> None:
-        self.statusBar().showMessage(f"Error: {exc}", 5000)
+        self.status_bar.showMessage(f"Error: {exc}", 5000)
         QMessageBox.critical(self, "Error", str(exc))
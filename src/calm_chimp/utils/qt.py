@@ -1,25 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import count
 from typing import Any, Callable, Optional
 
-from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
 
 
 class TaskSignals(QObject):
-    completed = pyqtSignal(object)
-    failed = pyqtSignal(Exception)
+    completed = pyqtSignal(int, object)
+    failed = pyqtSignal(int, Exception)
 
 
 class _Runnable(QRunnable):
     def __init__(
         self,
+        task_id: int,
         fn: Callable[..., Any],
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
         signals: TaskSignals,
     ) -> None:
         super().__init__()
+        self.task_id = task_id
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
@@ -29,13 +32,14 @@ class _Runnable(QRunnable):
         try:
             result = self.fn(*self.args, **self.kwargs)
         except Exception as exc:  # noqa: BLE001
-            self.signals.failed.emit(exc)
+            self.signals.failed.emit(self.task_id, exc)
         else:
-            self.signals.completed.emit(result)
+            self.signals.completed.emit(self.task_id, result)
 
 
 @dataclass
 class TaskHandle:
+    task_id: int
     signals: TaskSignals
 
 
@@ -44,6 +48,14 @@ class TaskRunner:
         self.pool = QThreadPool.globalInstance()
         if max_threads is not None:
             self.pool.setMaxThreadCount(max_threads)
+        # One signals object per runner, created on the owning (GUI) thread; results are
+        # routed back to their callbacks by task id instead of allocating a QObject per task.
+        self.signals = TaskSignals()
+        # Emits always come from pool threads, so declare the queued hop instead of auto-detecting it.
+        self.signals.completed.connect(self._on_completed, Qt.ConnectionType.QueuedConnection)
+        self.signals.failed.connect(self._on_failed, Qt.ConnectionType.QueuedConnection)
+        self._callbacks: dict[int, tuple[Optional[Callable[[Any], None]], Optional[Callable[[Exception], None]]]] = {}
+        self._task_ids = count()
 
     def submit(
         self,
@@ -53,11 +65,19 @@ class TaskRunner:
         on_error: Optional[Callable[[Exception], None]] = None,
         **kwargs: Any,
     ) -> TaskHandle:
-        signals = TaskSignals()
+        task_id = next(self._task_ids)
+        if on_success or on_error:
+            self._callbacks[task_id] = (on_success, on_error)
+        runnable = _Runnable(task_id, fn, args, kwargs, self.signals)
+        self.pool.start(runnable)
+        return TaskHandle(task_id=task_id, signals=self.signals)
+
+    def _on_completed(self, task_id: int, result: Any) -> None:
+        on_success, _ = self._callbacks.pop(task_id, (None, None))
         if on_success:
-            signals.completed.connect(on_success)
+            on_success(result)
+
+    def _on_failed(self, task_id: int, exc: Exception) -> None:
+        _, on_error = self._callbacks.pop(task_id, (None, None))
         if on_error:
-            signals.failed.connect(on_error)
-        runnable = _Runnable(fn, args, kwargs, signals)
-        self.pool.start(runnable)
-        return TaskHandle(signals=signals)
+            on_error(exc)